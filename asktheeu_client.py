@@ -7,47 +7,393 @@ freedom of information requests to EU institutions.
 """
 
 import os
+import random
+import re
+import threading
+import time
 import requests
 import urllib.parse
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from lxml import etree
 from typing import Dict, Any, Optional, List
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from dotenv import load_dotenv
-from datetime import datetime
+from http.cookiejar import LWPCookieJar
 
-# Load environment variables from .env file if it exists
-env_path = Path('.env')
-if env_path.exists():
-    load_dotenv(env_path)
+# Browser-matching headers shared by every request. Set once on the Session in
+# __init__ so call sites only pass the handful of values that actually vary.
+_COMMON_HEADERS = {
+    'accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8',
+    'accept-language': 'en-GB,en-US;q=0.9,en;q=0.8',
+    'sec-ch-ua': '"Google Chrome";v="135", "Not-A.Brand";v="8", "Chromium";v="135"',
+    'sec-ch-ua-mobile': '?0',
+    'sec-ch-ua-platform': '"macOS"',
+    'sec-fetch-dest': 'document',
+    'sec-fetch-mode': 'navigate',
+    'sec-fetch-site': 'same-origin',
+    'sec-fetch-user': '?1',
+    'upgrade-insecure-requests': '1',
+    'user-agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/135.0.0.0 Safari/537.36'
+}
+
+# Markers that only appear in the signed-in version of a page. One compiled
+# alternation scans the body once instead of one full pass per marker.
+_LOGIN_SUCCESS_RE = re.compile(rb"Sign out|sign_out|Your profile|alaveteli_pro/dashboard|logout", re.IGNORECASE)
+
+# Numeric draft id in a Pro info-request link, e.g. href="/en/alaveteli_pro/info_requests/123"
+_DRAFT_ID_RE = re.compile(rb'/en/alaveteli_pro/info_requests/(\d+)(?:["/?#]|$)')
+
+# Request/preview slugs in URLs, Location headers and hrefs. One compiled
+# pattern replaces the split('/request/')/split('/') chains at each site.
+_REQUEST_ID_RE = re.compile(r'/request/([^/?#]+)')
+_REQUEST_LINK_RE = re.compile(rb'href="[^"]*?/request/([^/"?#]+)')
+_PREVIEW_ID_RE = re.compile(r'/preview/([^/?#]+)')
+
+# "Not found" page titles, checked on the raw bytes before any parsing so the
+# no-access case never pays for building a DOM.
+_TITLE_NOT_FOUND_RE = re.compile(rb'<title[^>]*>[^<]*not found', re.IGNORECASE)
+
+# Sign-in token input as served today (id before value). Scanned over the raw
+# stream in login as a fast path; the pull parser remains the fallback for any
+# attribute ordering this pattern does not anticipate.
+_SIGNIN_TOKEN_RE = re.compile(rb'<input[^>]*\bid="signin_token"[^>]*\bvalue="([^"]+)"')
+
+# How long a scraped CSRF token is trusted before the next page fetch
+# refreshes it. Alaveteli tokens are session-scoped and long-lived.
+_CSRF_TOKEN_TTL = 600.0
+
+# Reused HTML parser, one per thread. etree.HTML() builds a fresh parser per
+# call; reusing an instance skips that setup, and the pages are parsed without
+# the id table, comments, processing instructions and whitespace-only text
+# nodes this client never looks at, which keeps every XPath walk over a
+# smaller tree. lxml parsers carry mutable state between feed/parse calls, so
+# the create_many / list_all_requests worker threads each get their own
+# instance instead of racing on a shared one.
+_parser_tls = threading.local()
+
+def _html_parser() -> etree.HTMLParser:
+    parser = getattr(_parser_tls, "parser", None)
+    if parser is None:
+        parser = _parser_tls.parser = etree.HTMLParser(
+            recover=True,
+            collect_ids=False,
+            remove_comments=True,
+            remove_pis=True,
+            remove_blank_text=True
+        )
+    return parser
+
+# Precompiled XPath expressions. lxml compiles an XPath string on every
+# .xpath() call, so expressions used on each response are compiled once here
+# and reused as callables.
+_XP_AUTH_TOKEN = etree.XPath('(//input[@name="authenticity_token"]/@value)[1]', smart_strings=False)
+# All known CSRF token locations in one union; the [1] predicate lets libxml2
+# stop at the first hit in a single tree walk
+_XP_ANY_TOKEN = etree.XPath(
+    '(//input[@name="authenticity_token"]/@value'
+    ' | //meta[@name="csrf-token"]/@content'
+    ' | //input[contains(@name, "token")]/@value)[1]',
+    smart_strings=False
+)
+# Listing selectors. All markup variants (Pro and both standard flavours) are
+# folded into single union expressions, so each item is walked once per field
+# and the [1] predicate stops at the first hit.
+_XP_LISTING_ITEMS = etree.XPath(
+    '//div[contains(@class, "request-list__request")'
+    ' or contains(@class, "request_listing")'
+    ' or contains(@class, "request-listing")]'
+)
+_XP_ITEM_TITLE_LINK = etree.XPath(
+    '(.//a[contains(@class, "request-list__request__title")'
+    ' or contains(@class, "request_listing__title")'
+    ' or contains(@class, "request-listing__title")]'
+    ' | .//h3/a | .//h4/a)[1]'
+)
+# Status and date come back as already-trimmed strings: normalize-space runs
+# inside libxml2, replacing the .text/strip()/default conditional per field
+# (an empty string means the field was absent).
+_XP_ITEM_STATUS = etree.XPath(
+    'normalize-space((.//span[contains(@class, "status")]'
+    ' | .//div[contains(@class, "status")]'
+    ' | .//p[contains(@class, "status")])[1])'
+)
+_XP_ITEM_DATE = etree.XPath(
+    'normalize-space((.//time'
+    ' | .//span[contains(@class, "date")]'
+    ' | .//div[contains(@class, "date")])[1])'
+)
+# Every caller only wants the first match, so the [1] predicate lets libxml2
+# stop the walk there instead of collecting the full node set.
+_XP_PREVIEW_FORM_ACTION = etree.XPath('(//form[@id="preview_form"]/@action)[1]', smart_strings=False)
+_XP_NEXT_PAGE = etree.XPath('(//a[@rel="next"]/@href)[1]', smart_strings=False)
+_XP_PREV_PAGE = etree.XPath('(//a[@rel="prev"]/@href)[1]', smart_strings=False)
+
+def _parse_html(content: bytes) -> etree._Element:
+    """
+    Parse a response body with the shared parser.
+
+    libxml2 raises on a zero-length document, which empty or redirect
+    responses can produce; fall back to an empty tree so the selector
+    lookups simply find nothing.
+    """
+    if not content:
+        return etree.fromstring(b"<html></html>", _html_parser())
+    return etree.fromstring(content, _html_parser())
+
+
+# Last-resort title fallback, kept out of the union above so the preferred
+# selectors decide first and a stray leading link cannot shadow the title.
+_XP_ITEM_ANY_LINK = etree.XPath('(.//a)[1]')
+
+
+def _parse_listing(content: bytes, domain: str, page: int) -> Dict[str, Any]:
+    """
+    Parse one listing page body into the list_requests result shape.
+
+    A module-level function with no client state: lxml releases the GIL
+    while parsing, so the list_all_requests worker threads can overlap one
+    page's parse with another's fetch.
+    """
+    requests_page = _parse_html(content)
+    requests = []
+
+    # Extract request info from the page. The union selectors cover the
+    # Pro and standard markup variants in one walk per field, so there is
+    # no per-page flavour detection and no per-item fallback chain
+    request_items = _XP_LISTING_ITEMS(requests_page)
+
+    # Every lookup below degrades to an empty list/string/None on odd
+    # markup, so malformed rows are skipped by plain truthiness checks
+    # with no per-row exception frame
+    for item in request_items:
+        # Title link for any variant, with an any-link fallback
+        title_elem = _XP_ITEM_TITLE_LINK(item) or _XP_ITEM_ANY_LINK(item)
+
+        if not title_elem:
+            continue
+
+        text = title_elem[0].text
+        title = text.strip() if text else "Untitled Request"
+        url = title_elem[0].get('href')
+
+        # Some URLs are relative, others are absolute
+        if url and not url.startswith('http'):
+            url = url if url.startswith('/') else f"/{url}"
+
+        # Try to extract request ID from URL
+        m = _REQUEST_ID_RE.search(url) if url else None
+        request_id = m.group(1) if m else None
+
+        # Status and date arrive as trimmed strings straight from the
+        # single-walk union selectors
+        status = _XP_ITEM_STATUS(item) or "Unknown"
+        date = _XP_ITEM_DATE(item) or None
+
+        requests.append({
+            "id": request_id,
+            "title": title,
+            "url": f"{domain}{url}" if url and not url.startswith('http') else url,
+            "status": status,
+            "date": date
+        })
+
+    # Get pagination info
+    next_page = _XP_NEXT_PAGE(requests_page)
+    prev_page = _XP_PREV_PAGE(requests_page)
+
+    return {
+        "success": True,
+        "requests": requests,
+        "pagination": {
+            "current_page": page,
+            "next_page": page + 1 if next_page else None,
+            "prev_page": page - 1 if prev_page and page > 1 else None
+        }
+    }
 
 
 class AskTheEUClient:
     """Client for interacting with AskTheEU.org for FOI requests using the Alaveteli Pro interface."""
 
+    # Fixed attribute set: no per-instance __dict__, and attribute access in
+    # the request/parse loops goes through the faster slot descriptors
+    __slots__ = (
+        "domain",
+        "email",
+        "password",
+        "session",
+        "cookie_file",
+        "_form_headers",
+        "_pro_draft_headers",
+        "_standard_draft_headers",
+        "_authenticated",
+        "_csrf_token",
+        "_csrf_fetched_at",
+        "_throttle_lock",
+        "_next_allowed",
+        "_loaded_cookies",
+        "_list_url_tpl",
+    )
+
     def __init__(
-        self, 
-        email: Optional[str] = None, 
+        self,
+        email: Optional[str] = None,
         password: Optional[str] = None,
-        domain: str = "https://www.asktheeu.org"
+        domain: str = "https://www.asktheeu.org",
+        cookie_file: Optional[str] = None
     ) -> None:
         """
         Initialize AskTheEU client.
-        
+
         Args:
             email: AskTheEU.org account email. If None, tries to get from environment.
             password: AskTheEU.org account password. If None, tries to get from environment.
             domain: AskTheEU.org domain. Defaults to "https://www.asktheeu.org".
+            cookie_file: Path used to persist session cookies between runs so
+                scripted invocations can skip the login round-trips. Defaults
+                to ASKTHEEU_COOKIE_FILE or ".asktheeu_cookies".
         """
         self.domain = domain
+
+        # Only touch the filesystem for a .env file when credentials were not
+        # supplied directly and are not already in the environment
+        if not (email and password) and not (
+            os.environ.get("ASKTHEEU_EMAIL") and os.environ.get("ASKTHEEU_PASSWORD")
+        ):
+            env_path = Path('.env')
+            if env_path.exists():
+                from dotenv import load_dotenv
+                load_dotenv(env_path)
+
         self.email = email or os.environ.get("ASKTHEEU_EMAIL")
         self.password = password or os.environ.get("ASKTHEEU_PASSWORD")
-        
+
         if not self.email or not self.password:
             raise ValueError("Email and password must be provided or set in environment variables")
-        
+
         self.session = requests.Session()
+        self.session.headers.update(_COMMON_HEADERS)
+
+        # Default pools are tiny (10 idle connections); a tuned adapter keeps
+        # the TLS connection warm across the login/draft/send sequence and
+        # retries transient failures instead of aborting the submission
+        adapter = HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=16,
+            max_retries=Retry(
+                total=5,
+                backoff_factor=0.5,
+                backoff_jitter=0.25,
+                status_forcelist=(429, 500, 502, 503, 504),
+                allowed_methods=frozenset(["GET", "POST"]),
+                respect_retry_after_header=True
+            )
+        )
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
+        # Form-POST headers only differ by referer between call sites; build
+        # the shared part (and the fixed-referer variants) once per instance
+        self._form_headers = {
+            'content-type': 'application/x-www-form-urlencoded',
+            'origin': self.domain
+        }
+        self._pro_draft_headers = {
+            **self._form_headers,
+            'referer': f"{self.domain}/en/alaveteli_pro/info_requests/new"
+        }
+        self._standard_draft_headers = {
+            **self._form_headers,
+            'referer': f"{self.domain}/new"
+        }
+
         self._authenticated = False
+        self._csrf_token: Optional[str] = None
+        self._csrf_fetched_at = 0.0
+        self._list_url_tpl: Optional[str] = None
+        self._throttle_lock = threading.Lock()
+        self._next_allowed = 0.0
+        self.cookie_file = cookie_file or os.environ.get("ASKTHEEU_COOKIE_FILE", ".asktheeu_cookies")
+        self._loaded_cookies = self._load_cookies()
+
+    def close(self) -> None:
+        """Release the session's pooled connections."""
+        self.session.close()
+
+    def __enter__(self) -> "AskTheEUClient":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def _load_cookies(self) -> bool:
+        """Load cookies saved by a previous run. Returns True if any were loaded."""
+        if not self.cookie_file or not Path(self.cookie_file).exists():
+            return False
+        jar = LWPCookieJar(self.cookie_file)
+        try:
+            jar.load(ignore_discard=True)
+        except OSError:
+            return False
+        for cookie in jar:
+            self.session.cookies.set_cookie(cookie)
+        return len(jar) > 0
+
+    def _save_cookies(self) -> None:
+        """Persist the session cookies so the next run can skip logging in."""
+        if not self.cookie_file:
+            return
+        jar = LWPCookieJar(self.cookie_file)
+        for cookie in self.session.cookies:
+            jar.set_cookie(cookie)
+        try:
+            jar.save(ignore_discard=True)
+        except OSError:
+            pass
     
+
+    def _request(self, method: str, url: str, **kwargs) -> requests.Response:
+        """
+        Issue an HTTP request through the shared session, spacing calls out
+        when the server has asked us to back off.
+
+        The adapter's Retry handles re-issuing an individual request, but
+        concurrent create_many workers would otherwise all resume hammering
+        the host the moment their own timer expired. A shared next-allowed
+        timestamp, set from a 429's Retry-After plus jitter, smooths the
+        whole client instead.
+        """
+        with self._throttle_lock:
+            wait = self._next_allowed - time.monotonic()
+        if wait > 0:
+            time.sleep(wait)
+
+        r = self.session.request(method, url, **kwargs)
+
+        # Alaveteli serves UTF-8; pinning it means any .text access decodes
+        # directly instead of running charset detection over the whole body
+        if r.encoding is None:
+            r.encoding = 'utf-8'
+
+        if r.status_code == 429:
+            try:
+                delay = float(r.headers.get("Retry-After", 1))
+            except ValueError:
+                delay = 1.0
+            with self._throttle_lock:
+                self._next_allowed = max(
+                    self._next_allowed,
+                    time.monotonic() + delay + random.uniform(0, 0.25)
+                )
+        return r
+
+    def _dump(self, name: str, content: bytes) -> None:
+        """Write a response body to disk for debugging and say where it went."""
+        with open(name, "wb") as f:
+            f.write(content)
+        print(f"Saved response to {name}")
+
     def login(self, debug=False) -> bool:
         """
         Log in to AskTheEU.org using the format from the example.txt curl representation.
@@ -62,53 +408,89 @@ class AskTheEUClient:
             if debug:
                 print("Already authenticated")
             return True
-        
+
+        # If a previous run left us cookies, a cheap probe of an authenticated
+        # page can skip the two login round-trips entirely
+        if self._loaded_cookies:
+            if debug:
+                print("Checking saved cookies against the Pro dashboard")
+            r = self._request(
+                "GET",
+                f"{self.domain}/en/alaveteli_pro/info_requests",
+                allow_redirects=False
+            )
+            if r.status_code == 200:
+                if debug:
+                    print("Saved session still valid, skipping login")
+                self._authenticated = True
+                return True
+            if debug:
+                print(f"Saved session rejected (status {r.status_code}), logging in again")
+            self._loaded_cookies = False
+
         if debug:
             print(f"Accessing login page: {self.domain}/profile/sign_in")
             
-        # Get the login page to extract token
-        r = self.session.get(f"{self.domain}/profile/sign_in")
-        
+        # A fresh sign-in invalidates any token scraped from the old session
+        self._csrf_token = None
+
+        # Get the login page to extract token. The sign-in form sits near the
+        # top of the page, so stream the body and stop reading as soon as the
+        # token input is seen instead of parsing the whole document
+        r = self._request("GET", f"{self.domain}/profile/sign_in", stream=True)
+
         if debug:
             print(f"Login page status code: {r.status_code}")
-            
-        login_page = etree.HTML(r.text)
-        
-        # Extract the signin token from the page (based on example.txt)
-        token = login_page.xpath('//input[@id="signin_token"]/@value')
-        
+
+        token = None
+        fallback_token = None
+        parser = etree.HTMLPullParser(events=("start",))
+        tail = b""
+        try:
+            for chunk in r.iter_content(chunk_size=8192):
+                # Fast path: one regex scan per chunk finds the token without
+                # any parsing; the tail carry covers an input tag split across
+                # a chunk boundary
+                m = _SIGNIN_TOKEN_RE.search(tail + chunk)
+                if m:
+                    token = m.group(1).decode()
+                    break
+                tail = chunk[-512:]
+                parser.feed(chunk)
+                for _event, elem in parser.read_events():
+                    if elem.tag != "input":
+                        continue
+                    # Prefer the signin_token from the example.txt flow, but
+                    # remember an authenticity_token as fallback
+                    if elem.get("id") == "signin_token" and elem.get("value"):
+                        token = elem.get("value")
+                        break
+                    if fallback_token is None and elem.get("name") == "authenticity_token" and elem.get("value"):
+                        fallback_token = elem.get("value")
+                if token:
+                    break
+        finally:
+            r.close()
+
         if not token:
             if debug:
                 print("No signin_token found in login page")
-            
-            # Try alternative token locations
-            token = login_page.xpath('//input[@name="authenticity_token"]/@value')
+            token = fallback_token
             if not token:
                 if debug:
                     print("No token found")
                 return False
-        
+
         if debug:
-            print(f"Found token: {token[0][:10]}...")
+            print(f"Found token: {token[:10]}...")
         
-        # Set headers to match the curl example
+        # Static browser headers come from the session; only the values that
+        # vary per call are passed here
         headers = {
-            'accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8,application/signed-exchange;v=b3;q=0.7',
-            'accept-language': 'en-GB,en-US;q=0.9,en;q=0.8',
+            **self._form_headers,
             'cache-control': 'no-cache',
-            'content-type': 'application/x-www-form-urlencoded',
-            'origin': self.domain,
             'pragma': 'no-cache',
-            'referer': f"{self.domain}/profile/sign_in?r=%2F",
-            'sec-ch-ua': '"Google Chrome";v="135", "Not-A.Brand";v="8", "Chromium";v="135"',
-            'sec-ch-ua-mobile': '?0',
-            'sec-ch-ua-platform': '"macOS"',
-            'sec-fetch-dest': 'document',
-            'sec-fetch-mode': 'navigate',
-            'sec-fetch-site': 'same-origin',
-            'sec-fetch-user': '?1',
-            'upgrade-insecure-requests': '1',
-            'user-agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/135.0.0.0 Safari/537.36'
+            'referer': f"{self.domain}/profile/sign_in?r=%2F"
         }
         
         # Prepare login data - exactly matching the curl example format
@@ -116,7 +498,7 @@ class AskTheEUClient:
             'authenticity_token': '',
             'user_signin[email]': self.email,
             'user_signin[password]': self.password,
-            'token': token[0],
+            'token': token,
             'modal': '',
             'commit': 'Sign in'
         }
@@ -129,37 +511,41 @@ class AskTheEUClient:
                 else:
                     print(f" - {k}: {v[:20] + '...' if isinstance(v, str) and len(v) > 20 else v}")
                 
+        # Encode the form once up front; the same bytes can be resent
+        # verbatim if the POST is retried
+        payload = urllib.parse.urlencode(login_data).encode('utf-8')
+
         # Submit login form with headers
-        r = self.session.post(
+        r = self._request(
+            "POST",
             url=f"{self.domain}/profile/sign_in",
             headers=headers,
-            data=login_data
+            data=payload,
+            stream=True
         )
         
         if debug:
             print(f"Login response status code: {r.status_code}")
         
-        # Check if login was successful
-        success_indicators = [
-            "Sign out" in r.text,
-            "sign_out" in r.text,
-            "Your profile" in r.text,
-            "alaveteli_pro/dashboard" in r.text,
-            "logout" in r.text.lower(),
-            r.url != f"{self.domain}/profile/sign_in"
-        ]
-        
-        self._authenticated = any(success_indicators)
-        
+        # A successful sign-in redirects away from the form; in that case the
+        # body is irrelevant and needn't be downloaded at all. Only scan the
+        # content for signed-in markers when the URL is inconclusive
+        self._authenticated = r.url != f"{self.domain}/profile/sign_in"
+        if self._authenticated:
+            r.close()
+        else:
+            self._authenticated = bool(_LOGIN_SUCCESS_RE.search(r.content))
+
+        if self._authenticated:
+            self._save_cookies()
+
         if debug:
             if self._authenticated:
                 print("Login successful")
             else:
                 print("Login failed")
                 # Save response for debugging
-                with open("login_response.html", "w") as f:
-                    f.write(r.text)
-                print("Saved login response to login_response.html")
+                self._dump("login_response.html", r.content)
         
         return self._authenticated
     
@@ -214,7 +600,86 @@ class AskTheEUClient:
         
         # If it failed for other reasons, return the Pro interface error
         return pro_result
-        
+
+    def create_many(
+        self,
+        items: List[Dict[str, Any]],
+        max_workers: int = 8
+    ) -> List[Dict[str, Any]]:
+        """
+        Create draft FOI requests for several items concurrently.
+
+        Logs in once, then overlaps the independent draft submissions on a
+        thread pool over the shared session so batch runs are not serialized
+        on network latency.
+
+        Args:
+            items: List of dicts of create_draft_request keyword arguments
+                (public_body_id, title, body, ...)
+            max_workers: Maximum number of drafts in flight at once
+
+        Returns:
+            List of result dicts in the same order as items
+        """
+        if not self._authenticated and not self.login():
+            return [{"success": False, "error": "Not authenticated"} for _ in items]
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(lambda item: self.create_draft_request(**item), items))
+
+    def _get_pro_token(self, debug: bool = False, force: bool = False) -> Dict[str, Any]:
+        """
+        Return the CSRF token for the Pro interface, fetching the new-request
+        page only when no token is cached yet (or force is True). Alaveteli
+        tokens are session-scoped, so one fetch after login covers many
+        submissions.
+        """
+        if (
+            self._csrf_token
+            and not force
+            and time.monotonic() - self._csrf_fetched_at < _CSRF_TOKEN_TTL
+        ):
+            return {"success": True, "token": self._csrf_token}
+
+        # Get the new request page to extract CSRF token
+        if debug:
+            print("Fetching Pro interface request page...")
+
+        r = self._request("GET", f"{self.domain}/en/alaveteli_pro/info_requests/new")
+        if r.status_code != 200:
+            if debug:
+                print(f"Failed to access Pro page, status code: {r.status_code}")
+            return {"success": False, "error": f"Failed to access Pro interface page: {r.status_code}"}
+
+        if debug:
+            # Save the response for debugging
+            self._dump("pro_interface_page.html", r.content)
+
+        # Check the page title for Pro access before paying for a parse;
+        # a "not found" title means there is no token to extract anyway
+        if _TITLE_NOT_FOUND_RE.search(r.content):
+            if debug:
+                print("Page title indicates no access")
+            return {"success": False, "error": "No access to Pro interface"}
+
+        request_page = _parse_html(r.content)
+
+        # One union expression covers the primary and alternative token
+        # locations in a single traversal
+        token = _XP_ANY_TOKEN(request_page)
+
+        if token and debug:
+            print(f"Found token: {token[0][:10]}...")
+
+        if not token:
+            if debug:
+                print("No authenticity token found in Pro interface")
+            return {"success": False, "error": "Could not find authenticity token in Pro interface"}
+
+        self._csrf_token = token[0]
+        self._csrf_fetched_at = time.monotonic()
+        return {"success": True, "token": self._csrf_token}
+
     def _try_pro_interface(
         self, 
         public_body_id: str,
@@ -225,105 +690,68 @@ class AskTheEUClient:
     ) -> Dict[str, Any]:
         """Try creating a request using the Alaveteli Pro interface."""
         try:
-            # Get the new request page to extract CSRF token
-            if debug:
-                print("Fetching Pro interface request page...")
-                
-            r = self.session.get(f"{self.domain}/en/alaveteli_pro/info_requests/new")
-            if r.status_code != 200:
-                if debug:
-                    print(f"Failed to access Pro page, status code: {r.status_code}")
-                return {"success": False, "error": f"Failed to access Pro interface page: {r.status_code}"}
-                
-            if debug:
-                # Save the response for debugging
-                with open("pro_interface_page.html", "w") as f:
-                    f.write(r.text)
-                print("Saved Pro interface page to pro_interface_page.html")
-                
-            request_page = etree.HTML(r.text)
-            
-            # Check page title to see if we have Pro access
-            page_title = request_page.xpath('//title/text()')
-            if page_title and "not found" in page_title[0].lower():
-                if debug:
-                    print(f"Page title indicates no access: {page_title[0]}")
-                return {"success": False, "error": "No access to Pro interface"}
-            
-            # Try to extract token
-            token = request_page.xpath('//input[@name="authenticity_token"]/@value')
-            
-            # Try alternative token locations if not found
-            if not token:
-                if debug:
-                    print("Primary token not found, trying alternatives...")
-                    
-                token = (request_page.xpath('//meta[@name="csrf-token"]/@content') or
-                        request_page.xpath('//input[contains(@name, "token")]/@value'))
-                        
-                if token and debug:
-                    print(f"Found alternative token: {token[0][:10]}...")
-                    
-            if not token:
-                if debug:
-                    print("No authenticity token found in Pro interface")
-                return {"success": False, "error": "Could not find authenticity token in Pro interface"}
-            
-            # Set headers similar to login headers
-            headers = {
-                'accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8',
-                'content-type': 'application/x-www-form-urlencoded',
-                'origin': self.domain,
-                'referer': f"{self.domain}/en/alaveteli_pro/info_requests/new",
-                'user-agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/135.0.0.0 Safari/537.36'
+            token_result = self._get_pro_token(debug=debug)
+            if not token_result.get("success"):
+                return token_result
+
+            data = {
+                "utf8": "✓",
+                "authenticity_token": token_result["token"],
+                "info_request[public_body_id]": public_body_id,
+                "info_request[title]": title,
+                "outgoing_message[body]": body,
+                "embargo[embargo_duration]": embargo_duration,
+                "preview": "true"
             }
-            
-            # Create draft request
+
+            # Create draft request. As in login, the form is encoded to bytes
+            # up front so the adapter's retries resend the same payload
+            # verbatim instead of re-encoding the dict
             if debug:
                 print("Submitting Pro interface draft request...")
-                
-            r = self.session.post(
+
+            r = self._request(
+                "POST",
                 url=f"{self.domain}/en/alaveteli_pro/draft_info_requests",
-                headers=headers,
-                data={
-                    "utf8": "✓",
-                    "authenticity_token": token[0],
-                    "info_request[public_body_id]": public_body_id,
-                    "info_request[title]": title,
-                    "outgoing_message[body]": body,
-                    "embargo[embargo_duration]": embargo_duration,
-                    "preview": "true"
-                }
+                headers=self._pro_draft_headers,
+                data=urllib.parse.urlencode(data).encode('utf-8')
             )
+
+            # A rejected token means the cached one went stale; refresh it
+            # once and resubmit
+            if r.status_code in (403, 422):
+                if debug:
+                    print(f"Draft POST rejected ({r.status_code}), refreshing token...")
+                token_result = self._get_pro_token(debug=debug, force=True)
+                if token_result.get("success"):
+                    data["authenticity_token"] = token_result["token"]
+                    r = self._request(
+                        "POST",
+                        url=f"{self.domain}/en/alaveteli_pro/draft_info_requests",
+                        headers=self._pro_draft_headers,
+                        data=urllib.parse.urlencode(data).encode('utf-8')
+                    )
             
             if debug:
                 print(f"Response status code: {r.status_code}")
                 
                 # Save the response for debugging
-                with open("pro_draft_response.html", "w") as f:
-                    f.write(r.text)
-                print("Saved response to pro_draft_response.html")
+                self._dump("pro_draft_response.html", r.content)
             
-            # Check for success and extract the draft ID
+            # Check for success and extract the draft ID. A numeric
+            # info_requests link only appears for a created draft, so one
+            # regex scan of the raw body replaces building a DOM for it
             if r.status_code == 200:
                 try:
-                    # Try to extract the draft ID from the response URL or content
-                    draft_page = etree.HTML(r.text)
-                    draft_links = draft_page.xpath('//a[contains(@href, "/en/alaveteli_pro/info_requests/")]/@href')
-                    
-                    if draft_links:
-                        for link in draft_links:
-                            # Extract the ID from the URL path
-                            parts = link.split('/')
-                            if len(parts) > 0:
-                                draft_id = parts[-1]
-                                if draft_id.isdigit():
-                                    return {
-                                        "success": True,
-                                        "method": "pro_interface",
-                                        "draft_id": draft_id,
-                                        "draft_url": f"{self.domain}/en/alaveteli_pro/info_requests/{draft_id}"
-                                    }
+                    m = _DRAFT_ID_RE.search(r.content)
+                    if m:
+                        draft_id = m.group(1).decode()
+                        return {
+                            "success": True,
+                            "method": "pro_interface",
+                            "draft_id": draft_id,
+                            "draft_url": f"{self.domain}/en/alaveteli_pro/info_requests/{draft_id}"
+                        }
                 except Exception as e:
                     if debug:
                         print(f"Error parsing Pro response: {str(e)}")
@@ -351,11 +779,11 @@ class AskTheEUClient:
             if debug:
                 print("Fetching standard interface request page...")
                 
-            r = self.session.get(f"{self.domain}/new?body={public_body_id}")
+            r = self._request("GET", f"{self.domain}/new?body={public_body_id}")
             
             if r.status_code != 200:
                 # Try alternative URL
-                r = self.session.get(f"{self.domain}/new")
+                r = self._request("GET", f"{self.domain}/new")
                 
                 if r.status_code != 200:
                     if debug:
@@ -364,48 +792,32 @@ class AskTheEUClient:
             
             if debug:
                 # Save the response for debugging
-                with open("standard_interface_page.html", "w") as f:
-                    f.write(r.text)
-                print("Saved standard interface page to standard_interface_page.html")
+                self._dump("standard_interface_page.html", r.content)
                 
-            request_page = etree.HTML(r.text)
+            request_page = _parse_html(r.content)
             
-            # Try to extract token
-            token = request_page.xpath('//input[@name="authenticity_token"]/@value')
-            
-            # Try alternative token locations if not found
-            if not token:
-                if debug:
-                    print("Primary token not found, trying alternatives...")
-                    
-                token = (request_page.xpath('//meta[@name="csrf-token"]/@content') or
-                        request_page.xpath('//input[contains(@name, "token")]/@value'))
-                        
-                if token and debug:
-                    print(f"Found alternative token: {token[0][:10]}...")
-                    
+            # One union expression covers the primary and alternative token
+            # locations in a single traversal
+            token = _XP_ANY_TOKEN(request_page)
+
+            if token and debug:
+                print(f"Found token: {token[0][:10]}...")
+
             if not token:
                 if debug:
                     print("No authenticity token found in standard interface")
                 return {"success": False, "error": "Could not find authenticity token in standard interface"}
             
-            # Set headers similar to login headers
-            headers = {
-                'accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8',
-                'content-type': 'application/x-www-form-urlencoded',
-                'origin': self.domain,
-                'referer': f"{self.domain}/new",
-                'user-agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/135.0.0.0 Safari/537.36'
-            }
             
             # Create draft request using the standard interface format
             if debug:
                 print("Submitting standard interface draft request...")
                 
-            r = self.session.post(
+            r = self._request(
+                "POST",
                 url=f"{self.domain}/new",
-                headers=headers,
-                data={
+                headers=self._standard_draft_headers,
+                data=urllib.parse.urlencode({
                     "authenticity_token": token[0],
                     "info_request[title]": title,
                     "outgoing_message[body]": body,
@@ -413,16 +825,14 @@ class AskTheEUClient:
                     "submitted_new_request": "1",
                     "preview": "1",
                     "commit": "Preview"
-                }
+                }).encode('utf-8')
             )
             
             if debug:
                 print(f"Response status code: {r.status_code}")
                 
                 # Save the response for debugging
-                with open("standard_draft_response.html", "w") as f:
-                    f.write(r.text)
-                print("Saved response to standard_draft_response.html")
+                self._dump("standard_draft_response.html", r.content)
             
             # Check for success - standard interface usually redirects to preview page
             if r.status_code in [200, 302]:
@@ -430,8 +840,9 @@ class AskTheEUClient:
                 draft_id = None
                 preview_url = r.url
                 
-                if "/preview/" in preview_url:
-                    draft_id = preview_url.split("/preview/")[-1].split("?")[0]
+                m = _PREVIEW_ID_RE.search(preview_url)
+                if m:
+                    draft_id = m.group(1)
                 
                 if draft_id:
                     return {
@@ -443,11 +854,12 @@ class AskTheEUClient:
                 else:
                     # Try to extract from HTML if URL doesn't contain it
                     try:
-                        preview_page = etree.HTML(r.text)
-                        form_action = preview_page.xpath('//form[@id="preview_form"]/@action')
+                        preview_page = _parse_html(r.content)
+                        form_action = _XP_PREVIEW_FORM_ACTION(preview_page)
                         
-                        if form_action and "/preview/" in form_action[0]:
-                            draft_id = form_action[0].split("/preview/")[-1]
+                        m = _PREVIEW_ID_RE.search(form_action[0]) if form_action else None
+                        if m:
+                            draft_id = m.group(1)
                             
                             return {
                                 "success": True,
@@ -488,50 +900,106 @@ class AskTheEUClient:
         else:
             # Send using standard interface
             return self._send_standard_request(draft_id)
-    
-    def _send_pro_request(self, draft_id: str) -> Dict[str, Any]:
-        """Send a request using the Pro interface."""
-        # Get the draft page to extract CSRF token
-        r = self.session.get(f"{self.domain}/en/alaveteli_pro/info_requests/{draft_id}")
+
+    def submit_request(
+        self,
+        public_body_id: str,
+        title: str,
+        body: str,
+        embargo_duration: str = "",
+        debug: bool = False
+    ) -> Dict[str, Any]:
+        """
+        Create a draft FOI request and send it in one call.
+
+        The draft creation leaves a fresh session token in the cache, so the
+        send that follows POSTs straight away instead of re-fetching the
+        draft page to re-discover it.
+
+        Args:
+            public_body_id: ID of the public body on AskTheEU.org
+            title: Title of the FOI request
+            body: Body text of the FOI request
+            embargo_duration: Optional embargo duration (e.g., "3_months")
+            debug: If True, print debug information
+
+        Returns:
+            Dict with response info for the send, plus the draft ID and URL
+        """
+        draft = self.create_draft_request(public_body_id, title, body, embargo_duration, debug)
+        if not draft.get("success"):
+            return draft
+
+        result = self.send_request(
+            draft["draft_id"],
+            is_pro=draft.get("method") == "pro_interface"
+        )
+        result["draft_id"] = draft["draft_id"]
+        result["draft_url"] = draft.get("draft_url")
+        return result
+
+    def _get_draft_token(self, draft_id: str) -> Dict[str, Any]:
+        """Fetch the CSRF token from a Pro draft page and refresh the cache."""
+        r = self._request("GET", f"{self.domain}/en/alaveteli_pro/info_requests/{draft_id}")
         if r.status_code != 200:
             return {"success": False, "error": f"Failed to access Pro draft request: {r.status_code}"}
-            
-        draft_page = etree.HTML(r.text)
-        token = draft_page.xpath('//input[@name="authenticity_token"]/@value')
+
+        draft_page = _parse_html(r.content)
+        token = _XP_AUTH_TOKEN(draft_page)
         if not token:
             return {"success": False, "error": "Could not find authenticity token"}
-        
-        # Set headers similar to login headers
-        headers = {
-            'accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8',
-            'content-type': 'application/x-www-form-urlencoded',
-            'origin': self.domain,
-            'referer': f"{self.domain}/en/alaveteli_pro/info_requests/{draft_id}",
-            'user-agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/135.0.0.0 Safari/537.36'
-        }
-        
-        # Send the request
-        r = self.session.post(
+
+        self._csrf_token = token[0]
+        self._csrf_fetched_at = time.monotonic()
+        return {"success": True, "token": self._csrf_token}
+
+    def _post_send(self, draft_id: str, token: str) -> requests.Response:
+        """POST the send form for a Pro draft."""
+        headers = {**self._form_headers, 'referer': f"{self.domain}/en/alaveteli_pro/info_requests/{draft_id}"}
+        return self._request(
+            "POST",
             url=f"{self.domain}/en/alaveteli_pro/info_requests/{draft_id}/send",
             headers=headers,
-            data={
+            data=urllib.parse.urlencode({
                 "utf8": "✓",
-                "authenticity_token": token[0],
+                "authenticity_token": token,
                 "commit": "Send request"
-            }
+            }).encode('utf-8')
         )
-        
+
+    def _send_pro_request(self, draft_id: str) -> Dict[str, Any]:
+        """Send a request using the Pro interface."""
+        # A fresh-enough session token means the create->send pipeline can
+        # POST straight away instead of GETting the draft page first
+        cached = (
+            self._csrf_token is not None
+            and time.monotonic() - self._csrf_fetched_at < _CSRF_TOKEN_TTL
+        )
+        if cached:
+            token = self._csrf_token
+        else:
+            token_result = self._get_draft_token(draft_id)
+            if not token_result.get("success"):
+                return token_result
+            token = token_result["token"]
+
+        # Send the request
+        r = self._post_send(draft_id, token)
+
+        # A rejected cached token is refreshed from the draft page and the
+        # send retried once
+        if cached and r.status_code in (403, 422):
+            token_result = self._get_draft_token(draft_id)
+            if token_result.get("success"):
+                r = self._post_send(draft_id, token_result["token"])
+
         # Check for success
         if r.status_code in [200, 302]:
             # Try to extract the public request ID from the response
             request_id = None
-            try:
-                if 'Location' in r.headers:
-                    location = r.headers['Location']
-                    if '/request/' in location:
-                        request_id = location.split('/request/')[-1].split('/')[0]
-            except Exception:
-                pass
+            m = _REQUEST_ID_RE.search(r.headers.get('Location', ''))
+            if m:
+                request_id = m.group(1)
             
             return {
                 "success": True,
@@ -547,32 +1015,27 @@ class AskTheEUClient:
     def _send_standard_request(self, draft_id: str) -> Dict[str, Any]:
         """Send a request using the standard interface."""
         # Get the preview page to extract CSRF token
-        r = self.session.get(f"{self.domain}/preview/{draft_id}")
+        r = self._request("GET", f"{self.domain}/preview/{draft_id}")
         if r.status_code != 200:
             return {"success": False, "error": f"Failed to access standard preview: {r.status_code}"}
             
-        preview_page = etree.HTML(r.text)
-        token = preview_page.xpath('//input[@name="authenticity_token"]/@value')
+        preview_page = _parse_html(r.content)
+        token = _XP_AUTH_TOKEN(preview_page)
         if not token:
             return {"success": False, "error": "Could not find authenticity token in preview"}
         
-        # Set headers similar to login headers
-        headers = {
-            'accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8',
-            'content-type': 'application/x-www-form-urlencoded',
-            'origin': self.domain,
-            'referer': f"{self.domain}/preview/{draft_id}",
-            'user-agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/135.0.0.0 Safari/537.36'
-        }
+        # Per-call headers on top of the session defaults
+        headers = {**self._form_headers, 'referer': f"{self.domain}/preview/{draft_id}"}
         
         # Send the request
-        r = self.session.post(
+        r = self._request(
+            "POST",
             url=f"{self.domain}/preview/{draft_id}",
             headers=headers,
-            data={
+            data=urllib.parse.urlencode({
                 "authenticity_token": token[0],
                 "submit": "1"
-            }
+            }).encode('utf-8')
         )
         
         # Check for success
@@ -581,24 +1044,16 @@ class AskTheEUClient:
             request_id = None
             
             # Check if we were redirected to the request
-            if "/request/" in r.url:
-                try:
-                    request_id = r.url.split("/request/")[-1].split("/")[0]
-                except Exception:
-                    pass
-                    
-            # If not found in URL, try to parse from the response
+            m = _REQUEST_ID_RE.search(r.url)
+            if m:
+                request_id = m.group(1)
+
+            # If not found in URL, scan the body for the first request link;
+            # no need to build a DOM just for an href
             if not request_id:
-                try:
-                    response_page = etree.HTML(r.text)
-                    request_links = response_page.xpath('//a[contains(@href, "/request/")]/@href')
-                    
-                    for link in request_links:
-                        if "/request/" in link:
-                            request_id = link.split("/request/")[-1].split("/")[0]
-                            break
-                except Exception:
-                    pass
+                m = _REQUEST_LINK_RE.search(r.content)
+                if m:
+                    request_id = m.group(1).decode()
             
             return {
                 "success": True,
@@ -624,124 +1079,98 @@ class AskTheEUClient:
         if not self._authenticated and not self.login():
             return {"success": False, "error": "Not authenticated"}
         
-        # Set headers similar to login headers
-        headers = {
-            'accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8',
-            'user-agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/135.0.0.0 Safari/537.36'
-        }
-        
-        # Try Pro interface first, then fall back to standard
-        r = self.session.get(
-            f"{self.domain}/en/alaveteli_pro/info_requests?page={page}",
-            headers=headers
+        # The working listing URL is discovered once and remembered, so later
+        # pages (and list_all_requests workers) go straight to it. Discovery
+        # probes each candidate with a cheap HEAD first, so a dead Pro URL
+        # never costs a full error-body download
+        candidates = (
+            f"{self.domain}/en/alaveteli_pro/info_requests?page={{page}}",
+            f"{self.domain}/profile/{self.email}/requests?page={{page}}",
+            f"{self.domain}/request/user?user_name={self.email}&page={{page}}",
         )
-        
-        # If Pro interface isn't available, try standard interface
-        if r.status_code != 200:
-            r = self.session.get(
-                f"{self.domain}/profile/{self.email}/requests?page={page}",
-                headers=headers
-            )
-            
-            # Try another standard path if the first fails
+
+        r = None
+        if self._list_url_tpl:
+            r = self._request("GET", self._list_url_tpl.format(page=page))
             if r.status_code != 200:
-                r = self.session.get(
-                    f"{self.domain}/request/user?user_name={self.email}&page={page}",
-                    headers=headers
-                )
-                
-                if r.status_code != 200:
-                    return {"success": False, "error": f"Failed to list requests: {r.status_code}"}
-        
-        requests_page = etree.HTML(r.text)
-        requests = []
-        
-        # Extract request info from the page - try both Pro and standard patterns
-        request_items = (
-            requests_page.xpath('//div[contains(@class, "request-list__request")]') or
-            requests_page.xpath('//div[contains(@class, "request_listing")]') or
-            requests_page.xpath('//div[contains(@class, "request-listing")]')
-        )
-        
-        for item in request_items:
-            try:
-                # Try different selectors for request title links
-                title_elem = (
-                    item.xpath('.//a[contains(@class, "request-list__request__title")]') or
-                    item.xpath('.//a[contains(@class, "request_listing__title")]') or
-                    item.xpath('.//a[contains(@class, "request-listing__title")]') or
-                    item.xpath('.//h3/a') or
-                    item.xpath('.//h4/a') or
-                    item.xpath('.//a')  # Fallback to any link
-                )
-                
-                if not title_elem:
+                # The cached choice stopped working; re-probe below
+                self._list_url_tpl = None
+
+        if self._list_url_tpl is None:
+            for tpl in candidates:
+                url = tpl.format(page=page)
+                probe = self._request("HEAD", url, allow_redirects=True)
+                if probe.status_code != 200:
+                    r = probe
                     continue
-                    
-                title = title_elem[0].text.strip() if title_elem[0].text else "Untitled Request"
-                url = title_elem[0].get('href')
-                
-                # Some URLs are relative, others are absolute
-                if url and not url.startswith('http'):
-                    url = url if url.startswith('/') else f"/{url}"
-                
-                # Try to extract request ID from URL
-                request_id = None
-                if url and '/request/' in url:
-                    request_id = url.split('/request/')[-1].split('/')[0]
-                
-                # Try to get status and date info looking for different patterns
-                status_elem = (
-                    item.xpath('.//span[contains(@class, "status")]') or
-                    item.xpath('.//div[contains(@class, "status")]') or
-                    item.xpath('.//p[contains(@class, "status")]')
-                )
-                status = status_elem[0].text.strip() if status_elem and status_elem[0].text else "Unknown"
-                
-                date_elem = (
-                    item.xpath('.//time') or
-                    item.xpath('.//span[contains(@class, "date")]') or
-                    item.xpath('.//div[contains(@class, "date")]')
-                )
-                date = date_elem[0].text.strip() if date_elem and date_elem[0].text else None
-                
-                requests.append({
-                    "id": request_id,
-                    "title": title,
-                    "url": f"{self.domain}{url}" if url and not url.startswith('http') else url,
-                    "status": status,
-                    "date": date
-                })
-            except Exception:
-                # Skip items that can't be parsed
-                continue
-        
-        # Get pagination info
-        next_page = requests_page.xpath('//a[@rel="next"]/@href')
-        prev_page = requests_page.xpath('//a[@rel="prev"]/@href')
+                r = self._request("GET", url)
+                if r.status_code == 200:
+                    self._list_url_tpl = tpl
+                    break
+            if self._list_url_tpl is None:
+                return {"success": False, "error": f"Failed to list requests: {r.status_code}"}
         
-        return {
-            "success": True,
-            "requests": requests,
-            "pagination": {
-                "current_page": page,
-                "next_page": page + 1 if next_page else None,
-                "prev_page": page - 1 if prev_page and page > 1 else None
-            }
-        }
+        return _parse_listing(r.content, self.domain, page)
+
+    def list_all_requests(
+        self,
+        max_pages: int = 50,
+        max_workers: int = 8
+    ) -> Dict[str, Any]:
+        """
+        Fetch every page of the user's FOI requests, overlapping page fetches.
+
+        The listing only reveals whether a next page exists, not the total
+        count, so after page 1 the following pages are fetched in concurrent
+        waves of max_workers and the crawl stops at the first page without
+        further results.
+
+        Args:
+            max_pages: Upper bound on pages fetched, as a safety stop
+            max_workers: Maximum number of page fetches in flight at once
+
+        Returns:
+            Dict with the combined request list and the number of pages read
+        """
+        first = self.list_requests(page=1)
+        if not first.get("success"):
+            return first
+
+        all_requests = list(first["requests"])
+        pages_fetched = 1
+        if not first["pagination"]["next_page"]:
+            return {"success": True, "requests": all_requests, "pages_fetched": pages_fetched}
+
+        next_page = 2
+        done = False
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            while not done and pages_fetched < max_pages:
+                wave = range(next_page, next_page + min(max_workers, max_pages - pages_fetched))
+                for result in executor.map(lambda p: self.list_requests(page=p), wave):
+                    pages_fetched += 1
+                    if not result.get("success") or not result["requests"]:
+                        done = True
+                        break
+                    all_requests.extend(result["requests"])
+                    if not result["pagination"]["next_page"]:
+                        done = True
+                next_page = wave[-1] + 1
+
+        return {"success": True, "requests": all_requests, "pages_fetched": pages_fetched}
 
 
 def create_foi_request(
     public_body_id: str,
     request_data: Dict[str, Any],
-    email: Optional[str] = None, 
+    email: Optional[str] = None,
     password: Optional[str] = None,
     domain: str = "https://www.asktheeu.org",
-    debug: bool = False
+    debug: bool = False,
+    client: Optional[AskTheEUClient] = None
 ) -> Dict[str, Any]:
     """
     Helper function to create a FOI request with AskTheEU.
-    
+
     Args:
         public_body_id: ID of the public body on AskTheEU.org
         request_data: Dict with title, body, and other request parameters
@@ -749,12 +1178,16 @@ def create_foi_request(
         password: Optional AskTheEU.org password. If None, uses environment variable.
         domain: AskTheEU.org domain. Defaults to "https://www.asktheeu.org".
         debug: If True, print debug information.
-        
+        client: Optional existing AskTheEUClient to reuse. An already
+            logged-in client skips the login round trip entirely.
+
     Returns:
         Dict with response info including success status and draft URL
     """
     try:
-        client = AskTheEUClient(email=email, password=password, domain=domain)
+        if client is None:
+            client = AskTheEUClient(email=email, password=password, domain=domain)
+        # login() is a no-op when the client is already authenticated
         if not client.login(debug=debug):
             return {"success": False, "error": "Login failed"}
         
@@ -775,6 +1208,38 @@ def create_foi_request(
         return {"success": False, "error": str(e)}
 
 
+def create_foi_requests(
+    items: List[Dict[str, Any]],
+    email: Optional[str] = None,
+    password: Optional[str] = None,
+    domain: str = "https://www.asktheeu.org",
+    max_workers: int = 8
+) -> List[Dict[str, Any]]:
+    """
+    Helper function to create several FOI requests in one batch.
+
+    Unlike calling create_foi_request in a loop, this logs in once and
+    overlaps the draft submissions on one client's session, so a batch of
+    K drafts costs roughly one round-trip instead of K.
+
+    Args:
+        items: List of dicts with public_body_id, title, body and optional
+            embargo_duration keys
+        email: Optional AskTheEU.org email. If None, uses environment variable.
+        password: Optional AskTheEU.org password. If None, uses environment variable.
+        domain: AskTheEU.org domain. Defaults to "https://www.asktheeu.org".
+        max_workers: Maximum number of drafts in flight at once
+
+    Returns:
+        List of result dicts in the same order as items
+    """
+    try:
+        client = AskTheEUClient(email=email, password=password, domain=domain)
+        return client.create_many(items, max_workers=max_workers)
+    except Exception as e:
+        return [{"success": False, "error": str(e)} for _ in items]
+
+
 if __name__ == "__main__":
     # Example usage
     import sys
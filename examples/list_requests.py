@@ -4,12 +4,15 @@ Script to list FOI requests using the AskTheEU.org client.
 """
 
 from asktheeu_client import AskTheEUClient
-import json
 
 def main():
-    # Create client (will use credentials from .env file)
-    client = AskTheEUClient()
-    
+    # Create client (will use credentials from .env file); the context manager
+    # keeps one pooled session alive for the whole run and closes it at the end
+    with AskTheEUClient() as client:
+        run(client)
+
+
+def run(client):
     # Log in to AskTheEU.org
     print("Logging in to AskTheEU.org...")
     if client.login():
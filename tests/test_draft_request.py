@@ -14,6 +14,10 @@ sys.path.append(str(Path(__file__).parent.parent))
 
 from asktheeu_client import AskTheEUClient
 
+# Full-page HTML dumps are only written when explicitly asked for, so normal
+# runs skip the blocking disk writes
+DUMP_PAGES = os.environ.get("ASKTHEEU_DEBUG_DUMPS") == "1"
+
 def test_draft_request_to_sg():
     """
     Test creating and sending a draft FOI request to the Secretariat General.
@@ -33,7 +37,7 @@ def test_draft_request_to_sg():
         return False
     
     print(f"✓ Using email: {email}")
-    print(f"✓ Password is set: {'*' * len(password)}")
+    print("✓ Password is set: ****")
     
     # Create client
     client = AskTheEUClient(email=email, password=password)
@@ -84,11 +88,12 @@ Test User
         r = client.session.get(f"{client.domain}/en/alaveteli_pro/info_requests/new")
         print(f"- Request page status code: {r.status_code}")
         
-        # Save the full page for debugging
-        with open("new_request_page.html", "w", encoding="utf-8") as page_file:
-            page_file.write(r.text)
+        # Save the full page for debugging only when dumps are requested
+        if DUMP_PAGES:
+            with open("new_request_page.html", "wb") as page_file:
+                page_file.write(r.content)
             print(f"- Saved full page to new_request_page.html")
-        
+
         # Parse and look for token
         from lxml import etree
         request_page = etree.HTML(r.text)
@@ -124,11 +129,15 @@ Test User
     except Exception as e:
         print(f"❌ Error checking for token: {str(e)}")
     
-    # Create draft request with debug file
-    with open("draft_request_debug.html", "w") as debug_file:
-        debug_file.write(f"Attempting to create draft request to SG (ID: {public_body_id})\n")
-        debug_file.write(f"Title: {title}\n\n")
-        
+    # Create draft request with a debug log. The log is buffered in memory
+    # and written in one go at the end, so no open file handle or per-line
+    # write syscall sits in the middle of the HTTP flow
+    debug_lines = [
+        f"Attempting to create draft request to SG (ID: {public_body_id})",
+        f"Title: {title}",
+        "",
+    ]
+    try:
         try:
             # Create draft request with debug enabled
             print("\nSending draft request to AskTheEU.org...")
@@ -139,10 +148,10 @@ Test User
                 debug=True
             )
             
-            # Save result to debug file
-            debug_file.write("\nResult:\n")
+            # Save result to the debug log
+            debug_lines.append("\nResult:")
             for key, value in result.items():
-                debug_file.write(f"- {key}: {value}\n")
+                debug_lines.append(f"- {key}: {value}")
                 print(f"- {key}: {value}")
             
             if not result.get("success"):
@@ -166,8 +175,8 @@ Test User
             print("NOTE: This step is commented out to prevent actual submission")
             print("To submit the request, uncomment the code below")
             
-            debug_file.write("\n\nSend Request Step:\n")
-            debug_file.write("This step is commented out to prevent actual submission\n")
+            debug_lines.append("\n\nSend Request Step:")
+            debug_lines.append("This step is commented out to prevent actual submission")
             
             """
             # Uncomment to actually send the request
@@ -176,10 +185,10 @@ Test User
             
             send_result = client.send_request(draft_id)
             
-            # Save send result to debug file
-            debug_file.write("\nSend Result:\n")
+            # Save send result to the debug log
+            debug_lines.append("\nSend Result:")
             for key, value in send_result.items():
-                debug_file.write(f"- {key}: {value}\n")
+                debug_lines.append(f"- {key}: {value}")
                 print(f"- {key}: {value}")
             
             if not send_result.get("success"):
@@ -199,9 +208,12 @@ Test User
             
         except Exception as e:
             error_msg = f"Error creating draft request: {str(e)}"
-            debug_file.write(f"\n\nEXCEPTION: {error_msg}\n")
+            debug_lines.append(f"\n\nEXCEPTION: {error_msg}")
             print(f"\n❌ EXCEPTION: {error_msg}")
             return False
+    finally:
+        # One syscall for the whole log, after the HTTP flow has finished
+        Path("draft_request_debug.html").write_text("\n".join(debug_lines) + "\n")
 
 if __name__ == "__main__":
     # Set up environment variables from .env file if it exists
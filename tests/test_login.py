@@ -6,10 +6,11 @@ Test script for AskTheEU.org login.
 from asktheeu_client import AskTheEUClient
 
 def main():
-    client = AskTheEUClient()
-    print("Attempting to log in to AskTheEU.org...\n")
-    result = client.login(debug=True)
-    print("\nFinal result:", "Login successful" if result else "Login failed")
+    # One client (and thus one pooled session) for the whole run
+    with AskTheEUClient() as client:
+        print("Attempting to log in to AskTheEU.org...\n")
+        result = client.login(debug=True)
+        print("\nFinal result:", "Login successful" if result else "Login failed")
 
 if __name__ == "__main__":
     main()
\ No newline at end of file